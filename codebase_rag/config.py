@@ -264,6 +264,7 @@ class AppConfig(BaseSettings):
     EMBEDDING_PROGRESS_INTERVAL: int = 10
 
     FLUSH_THREAD_POOL_SIZE: int = Field(default=4, gt=0)
+    PARSE_THREAD_POOL_SIZE: int = Field(default=4, gt=0)
     FILE_FLUSH_INTERVAL: int = Field(default=500, gt=0)
 
     CACHE_MAX_ENTRIES: int = 1000
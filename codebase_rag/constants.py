@@ -394,11 +394,6 @@ PATH_PARENT_PREFIX = "../"
 CPP_IMPORT_PARTITION_PREFIX = "import :"
 CPP_PARTITION_PREFIX = "partition_"
 
-# (H) Trie internal keys
-TRIE_TYPE_KEY = "__type__"
-TRIE_QN_KEY = "__qn__"
-TRIE_INTERNAL_PREFIX = "__"
-
 
 class UniqueKeyType(StrEnum):
     NAME = KEY_NAME
@@ -3,7 +3,15 @@ import json
 import os
 import sys
 from collections import OrderedDict, defaultdict
-from collections.abc import Callable, ItemsView, KeysView
+from collections.abc import (
+    Callable,
+    Collection,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    MutableSet,
+)
 from pathlib import Path
 
 from loguru import logger
@@ -13,7 +21,7 @@ from tree_sitter import Node, Parser, QueryCursor
 from . import constants as cs
 from . import logs as ls
 from .config import settings
-from .language_spec import LANGUAGE_FQN_SPECS, get_language_spec
+from .language_spec import LANGUAGE_FQN_SPECS, LANGUAGE_SPECS
 from .parser_loader import COMBINED_FUNC_CLASS_IMPORT_QUERIES
 from .parsers.cpp_frontend import (
     cpp_frontend_available,
@@ -21,6 +29,7 @@ from .parsers.cpp_frontend import (
     run_cpp_frontend,
 )
 from .parsers.factory import ProcessorFactory
+from .parsers.incremental import IncrementalParser, ParseJob
 from .parsers.utils import sorted_captures
 from .services import IngestorProtocol, QueryProtocol
 from .types_defs import (
@@ -31,7 +40,6 @@ from .types_defs import (
     QualifiedName,
     ResultRow,
     SimpleNameLookup,
-    TrieNode,
 )
 from .utils.dependencies import has_semantic_dependencies
 from .utils.fqn_resolver import find_function_source_by_fqn
@@ -45,6 +53,95 @@ from .utils.source_extraction import extract_source_with_fallback
 type FileHashCache = dict[str, str]
 type DirMtimesCache = dict[str, float]
 
+_SMALL_BUCKET_MAX = 8
+
+
+class _SimpleNameBucket(MutableSet[QualifiedName]):
+    __slots__ = ("_items", "_name", "_reverse")
+
+    def __init__(
+        self, name: str, reverse: dict[QualifiedName, tuple[str, ...]]
+    ) -> None:
+        self._items: list[QualifiedName] | dict[QualifiedName, None] = []
+        self._name = name
+        self._reverse = reverse
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[QualifiedName]) -> set[QualifiedName]:
+        return set(it)
+
+    def __contains__(self, qualified_name: object) -> bool:
+        return qualified_name in self._items
+
+    def __iter__(self) -> Iterator[QualifiedName]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items)!r})"
+
+    def add(self, qualified_name: QualifiedName) -> None:
+        items = self._items
+        if qualified_name not in items:
+            qualified_name = sys.intern(qualified_name)
+            if isinstance(items, dict):
+                items[qualified_name] = None
+            else:
+                items.append(qualified_name)
+                if len(items) > _SMALL_BUCKET_MAX:
+                    self._items = dict.fromkeys(items)
+            if qualified_name.rpartition(cs.SEPARATOR_DOT)[2] != self._name:
+                reverse = self._reverse
+                reverse[qualified_name] = (*reverse.get(qualified_name, ()), self._name)
+
+    def update(self, qualified_names: Iterable[QualifiedName]) -> None:
+        for qualified_name in qualified_names:
+            self.add(qualified_name)
+
+    def discard(self, qualified_name: QualifiedName) -> None:
+        items = self._items
+        if isinstance(items, dict):
+            items.pop(qualified_name, None)
+        elif qualified_name in items:
+            items.remove(qualified_name)
+
+
+class SimpleNameIndex(defaultdict[str, MutableSet[QualifiedName]]):
+    __slots__ = ("qn_to_names",)
+
+    def __init__(self) -> None:
+        super().__init__(set)
+        self.qn_to_names: dict[QualifiedName, tuple[str, ...]] = {}
+
+    def __missing__(self, name: str) -> MutableSet[QualifiedName]:
+        name = sys.intern(name)
+        bucket = _SimpleNameBucket(name, self.qn_to_names)
+        self[name] = bucket
+        return bucket
+
+    def discard_qn(self, qualified_name: QualifiedName) -> set[str]:
+        cleaned: set[str] = set()
+        last = qualified_name.rpartition(cs.SEPARATOR_DOT)[2]
+        for name in (last, *self.qn_to_names.pop(qualified_name, ())):
+            bucket = self.get(name)
+            if bucket is not None and qualified_name in bucket:
+                bucket.discard(qualified_name)
+                cleaned.add(name)
+        return cleaned
+
+
+class _TrieNode:
+    # (H) `label` is the compressed run of components on the edge leading here;
+    # (H) `edges` is keyed by the first component of each child's label.
+    __slots__ = ("label", "edges", "qn")
+
+    def __init__(self, label: tuple[str, ...] = ()) -> None:
+        self.label = label
+        self.edges: dict[str, _TrieNode] | None = None
+        self.qn: QualifiedName | None = None
+
 
 class FunctionRegistryTrie:
     __slots__ = (
@@ -52,21 +149,27 @@ class FunctionRegistryTrie:
         "_entries",
         "_simple_name_lookup",
         "_ending_with_cache",
+        "_suffix_index",
         "_duplicates",
+        "_variant_of",
         "_properties",
         "_property_names",
+        "_property_name_counts",
         "_abstracts",
         "_callable_params",
     )
 
     def __init__(self, simple_name_lookup: SimpleNameLookup | None = None) -> None:
-        self.root: TrieNode = {}
+        self.root = _TrieNode()
         self._entries: FunctionRegistry = {}
         self._simple_name_lookup = simple_name_lookup
         self._ending_with_cache: dict[str, list[QualifiedName]] = {}
+        self._suffix_index: dict[str, dict[QualifiedName, None]] = {}
         self._duplicates: dict[QualifiedName, list[QualifiedName]] = {}
+        self._variant_of: dict[QualifiedName, QualifiedName] = {}
         self._properties: set[QualifiedName] = set()
         self._property_names: set[str] = set()
+        self._property_name_counts: dict[str, int] = {}
         self._abstracts: set[QualifiedName] = set()
         self._callable_params: dict[QualifiedName, dict[str, int]] = {}
 
@@ -80,8 +183,12 @@ class FunctionRegistryTrie:
         return self._callable_params.get(qualified_name)
 
     def mark_property(self, qualified_name: QualifiedName) -> None:
+        if qualified_name in self._properties:
+            return
         self._properties.add(qualified_name)
-        self._property_names.add(qualified_name.rsplit(cs.SEPARATOR_DOT, 1)[-1])
+        name = qualified_name.rsplit(cs.SEPARATOR_DOT, 1)[-1]
+        self._property_names.add(name)
+        self._property_name_counts[name] = self._property_name_counts.get(name, 0) + 1
 
     def is_property(self, qualified_name: QualifiedName) -> bool:
         return qualified_name in self._properties
@@ -104,33 +211,76 @@ class FunctionRegistryTrie:
         bucket = self._duplicates.setdefault(natural_qn, [natural_qn])
         if variant not in bucket:
             bucket.append(variant)
+            self._variant_of[variant] = natural_qn
         return variant
 
     def variants(self, qualified_name: QualifiedName) -> list[QualifiedName]:
         return self._duplicates.get(qualified_name, [qualified_name])
 
     def insert(self, qualified_name: QualifiedName, func_type: NodeType) -> None:
+        self.insert_parts(
+            tuple(
+                [sys.intern(part) for part in qualified_name.split(cs.SEPARATOR_DOT)]
+            ),
+            func_type,
+            qualified_name,
+        )
+
+    def bulk_insert(self, items: Iterable[tuple[QualifiedName, NodeType]]) -> None:
+        self._ending_with_cache.clear()
+        for qualified_name, func_type in items:
+            self.insert(qualified_name, func_type)
+
+    def insert_parts(
+        self,
+        parts: tuple[str, ...],
+        func_type: NodeType,
+        qualified_name: QualifiedName | None = None,
+    ) -> None:
+        if qualified_name is None:
+            qualified_name = cs.SEPARATOR_DOT.join(parts)
         qualified_name = sys.intern(qualified_name)
         self._entries[qualified_name] = func_type
 
-        simple_name = qualified_name.rsplit(cs.SEPARATOR_DOT, 1)[-1]
+        simple_name = parts[-1]
         if self._simple_name_lookup is not None:
             self._simple_name_lookup[simple_name].add(qualified_name)
+        else:
+            self._suffix_index.setdefault(simple_name, {})[qualified_name] = None
         if self._ending_with_cache:
             self._ending_with_cache.pop(simple_name, None)
 
-        parts = qualified_name.split(cs.SEPARATOR_DOT)
-        current: TrieNode = self.root
-
-        for part in parts:
-            if part not in current:
-                current[part] = {}
-            child = current[part]
-            assert isinstance(child, dict)
-            current = child
-
-        current[cs.TRIE_TYPE_KEY] = func_type
-        current[cs.TRIE_QN_KEY] = qualified_name
+        node = self.root
+        i = 0
+        n = len(parts)
+        while i < n:
+            edges = node.edges
+            if edges is None or (child := edges.get(parts[i])) is None:
+                child = _TrieNode(parts[i:])
+                if edges is None:
+                    node.edges = {parts[i]: child}
+                else:
+                    edges[parts[i]] = child
+                node = child
+                break
+            label = child.label
+            matched = 1
+            while (
+                matched < len(label)
+                and i + matched < n
+                and label[matched] == parts[i + matched]
+            ):
+                matched += 1
+            if matched < len(label):
+                split = _TrieNode(label[:matched])
+                child.label = label[matched:]
+                split.edges = {child.label[0]: child}
+                edges[parts[i]] = split
+                child = split
+            node = child
+            i += matched
+
+        node.qn = qualified_name
 
     def get(
         self, qualified_name: QualifiedName, default: NodeType | None = None
@@ -151,9 +301,12 @@ class FunctionRegistryTrie:
             return
 
         del self._entries[qualified_name]
-        self._duplicates.pop(qualified_name, None)
-        for natural, bucket in list(self._duplicates.items()):
-            if qualified_name in bucket:
+        if (own_bucket := self._duplicates.pop(qualified_name, None)) is not None:
+            for variant in own_bucket:
+                self._variant_of.pop(variant, None)
+        if (natural := self._variant_of.pop(qualified_name, None)) is not None:
+            bucket = self._duplicates.get(natural)
+            if bucket is not None and qualified_name in bucket:
                 bucket.remove(qualified_name)
                 if len(bucket) <= 1:
                     self._duplicates.pop(natural, None)
@@ -161,10 +314,10 @@ class FunctionRegistryTrie:
 
         if qualified_name in self._properties:
             self._properties.discard(qualified_name)
-            if not any(
-                p.rsplit(cs.SEPARATOR_DOT, 1)[-1] == simple_name
-                for p in self._properties
-            ):
+            remaining = self._property_name_counts.pop(simple_name, 1) - 1
+            if remaining:
+                self._property_name_counts[simple_name] = remaining
+            else:
                 self._property_names.discard(simple_name)
         self._abstracts.discard(qualified_name)
         self._callable_params.pop(qualified_name, None)
@@ -175,61 +328,82 @@ class FunctionRegistryTrie:
         if self._simple_name_lookup is not None:
             if simple_name in self._simple_name_lookup:
                 self._simple_name_lookup[simple_name].discard(qualified_name)
-
-        parts = qualified_name.split(cs.SEPARATOR_DOT)
-        self._cleanup_trie_path(parts, self.root)
-
-    def _cleanup_trie_path(self, parts: list[str], node: TrieNode) -> bool:
-        if not parts:
-            node.pop(cs.TRIE_QN_KEY, None)
-            node.pop(cs.TRIE_TYPE_KEY, None)
-            return not node
-
-        part = parts[0]
-        if part not in node:
-            return False
-
-        child = node[part]
-        assert isinstance(child, dict)
-        if self._cleanup_trie_path(parts[1:], child):
-            del node[part]
-
-        is_endpoint = cs.TRIE_QN_KEY in node
-        has_children = any(not key.startswith(cs.TRIE_INTERNAL_PREFIX) for key in node)
-        return not has_children and not is_endpoint
-
-    def _navigate_to_prefix(self, prefix: str) -> TrieNode | None:
-        parts = prefix.split(cs.SEPARATOR_DOT) if prefix else []
-        current: TrieNode = self.root
-        for part in parts:
-            if part not in current:
+        elif (bucket := self._suffix_index.get(simple_name)) is not None:
+            bucket.pop(qualified_name, None)
+            if not bucket:
+                del self._suffix_index[simple_name]
+
+        self._remove_from_trie(tuple(qualified_name.split(cs.SEPARATOR_DOT)))
+
+    def _remove_from_trie(self, parts: tuple[str, ...]) -> None:
+        path: list[tuple[_TrieNode, dict[str, _TrieNode], str]] = []
+        node = self.root
+        i = 0
+        n = len(parts)
+        while i < n:
+            edges = node.edges
+            if edges is None or (child := edges.get(parts[i])) is None:
+                return
+            label = child.label
+            if parts[i : i + len(label)] != label:
+                return
+            path.append((node, edges, parts[i]))
+            node = child
+            i += len(label)
+
+        node.qn = None
+
+        # (H) Drop emptied leaves bottom-up, then re-compress the first
+        # (H) ancestor left with a single child and no entry of its own.
+        while path:
+            parent, parent_edges, key = path.pop()
+            if node.qn is not None:
+                break
+            if not node.edges:
+                del parent_edges[key]
+                if not parent_edges:
+                    parent.edges = None
+                node = parent
+                continue
+            if len(node.edges) == 1:
+                (only_child,) = node.edges.values()
+                only_child.label = node.label + only_child.label
+                parent_edges[key] = only_child
+            break
+
+    def _navigate_to_prefix(self, prefix: str) -> _TrieNode | None:
+        parts = tuple(prefix.split(cs.SEPARATOR_DOT)) if prefix else ()
+        node = self.root
+        i = 0
+        n = len(parts)
+        while i < n:
+            child = node.edges.get(parts[i]) if node.edges is not None else None
+            if child is None:
+                return None
+            label = child.label
+            take = min(len(label), n - i)
+            if parts[i : i + take] != label[:take]:
                 return None
-            child = current[part]
-            assert isinstance(child, dict)
-            current = child
-        return current
+            # (H) A prefix ending mid-edge still selects the whole subtree.
+            node = child
+            i += take
+        return node
 
     def _collect_from_subtree(
         self,
-        node: TrieNode,
+        node: _TrieNode,
         filter_fn: Callable[[QualifiedName], bool] | None = None,
     ) -> list[tuple[QualifiedName, NodeType]]:
         results: list[tuple[QualifiedName, NodeType]] = []
-
-        def dfs(n: TrieNode) -> None:
-            if cs.TRIE_QN_KEY in n:
-                qn = n[cs.TRIE_QN_KEY]
-                func_type = n[cs.TRIE_TYPE_KEY]
-                assert isinstance(qn, str) and isinstance(func_type, NodeType)
-                if filter_fn is None or filter_fn(qn):
-                    results.append((qn, func_type))
-
-            for key, child in n.items():
-                if not key.startswith(cs.TRIE_INTERNAL_PREFIX):
-                    assert isinstance(child, dict)
-                    dfs(child)
-
-        dfs(node)
+        entries = self._entries
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            qn = current.qn
+            if qn is not None and (filter_fn is None or filter_fn(qn)):
+                results.append((qn, entries[qn]))
+            if current.edges:
+                stack.extend(reversed(current.edges.values()))
         return results
 
     def keys(self) -> KeysView[QualifiedName]:
@@ -241,17 +415,35 @@ class FunctionRegistryTrie:
     def __len__(self) -> int:
         return len(self._entries)
 
+    def _suffix_bucket(self, suffix: str) -> Collection[QualifiedName] | None:
+        simple_name = suffix.rsplit(cs.SEPARATOR_DOT, 1)[-1]
+        if self._simple_name_lookup is not None:
+            return self._simple_name_lookup.get(simple_name)
+        return self._suffix_index.get(simple_name)
+
+    def _suffix_candidates(self, suffix: str) -> list[QualifiedName]:
+        bucket = self._suffix_bucket(suffix)
+        if not bucket:
+            return []
+        suffix_pattern = f".{suffix}"
+        return [qn for qn in bucket if qn.endswith(suffix_pattern)]
+
     def find_with_prefix_and_suffix(
         self, prefix: str, suffix: str
     ) -> list[QualifiedName]:
-        node = self._navigate_to_prefix(prefix)
-        if node is None:
+        if not prefix:
+            return sorted(self._suffix_candidates(suffix))
+        bucket = self._suffix_bucket(suffix)
+        if not bucket:
             return []
         suffix_pattern = f".{suffix}"
-        matches = self._collect_from_subtree(
-            node, lambda qn: qn.endswith(suffix_pattern)
+        prefix_pattern = f"{prefix}."
+        return sorted(
+            qn
+            for qn in bucket
+            if qn.endswith(suffix_pattern)
+            and (qn.startswith(prefix_pattern) or qn == prefix)
         )
-        return [qn for qn, _ in matches]
 
     def find_ending_with(self, suffix: str) -> list[QualifiedName]:
         cached = self._ending_with_cache.get(suffix)
@@ -263,9 +455,7 @@ class FunctionRegistryTrie:
             else:
                 result = []
         else:
-            result = sorted(
-                qn for qn in self._entries.keys() if qn.endswith(f".{suffix}")
-            )
+            result = sorted(self._suffix_candidates(suffix))
         self._ending_with_cache[suffix] = result
         return result
 
@@ -275,7 +465,7 @@ class FunctionRegistryTrie:
 
 
 class BoundedASTCache:
-    __slots__ = ("cache", "max_entries", "max_memory_bytes")
+    __slots__ = ("cache", "languages", "on_evict", "max_entries", "max_memory_bytes")
 
     def __init__(
         self,
@@ -283,6 +473,9 @@ class BoundedASTCache:
         max_memory_mb: int | None = None,
     ):
         self.cache: OrderedDict[Path, tuple[Node, cs.SupportedLanguage]] = OrderedDict()
+        # (H) Outlives eviction so the call pass can re-parse dropped trees.
+        self.languages: dict[Path, cs.SupportedLanguage] = {}
+        self.on_evict: Callable[[Path], None] | None = None
         self.max_entries = (
             max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
         )
@@ -296,6 +489,8 @@ class BoundedASTCache:
             del self.cache[key]
 
         self.cache[key] = value
+        self.languages.pop(key, None)
+        self.languages[key] = value[1]
 
         self._enforce_limits()
 
@@ -307,6 +502,7 @@ class BoundedASTCache:
     def __delitem__(self, key: Path) -> None:
         if key in self.cache:
             del self.cache[key]
+        self.languages.pop(key, None)
 
     def __contains__(self, key: Path) -> bool:
         return key in self.cache
@@ -316,7 +512,7 @@ class BoundedASTCache:
 
     def _enforce_limits(self) -> None:
         while len(self.cache) > self.max_entries:
-            self.cache.popitem(last=False)  # (H) Remove least recently used
+            self._evict_oldest()  # (H) Remove least recently used
 
         if self._should_evict_for_memory():
             entries_to_remove = max(
@@ -324,7 +520,12 @@ class BoundedASTCache:
             )
             for _ in range(entries_to_remove):
                 if self.cache:
-                    self.cache.popitem(last=False)
+                    self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        key, _ = self.cache.popitem(last=False)
+        if self.on_evict is not None:
+            self.on_evict(key)
 
     def _should_evict_for_memory(self) -> bool:
         try:
@@ -409,6 +610,26 @@ def _touch_empty_json(cache_path: Path) -> None:
         pass
 
 
+def _entry_name(entry: os.DirEntry[str]) -> str:
+    return entry.name
+
+
+def _parseable_suffixes(
+    parsers: dict[cs.SupportedLanguage, Parser],
+) -> dict[str, cs.SupportedLanguage]:
+    # (H) Same last-extension-wins resolution as get_language_spec.
+    by_suffix = {
+        ext: spec.language
+        for spec in LANGUAGE_SPECS.values()
+        for ext in spec.file_extensions
+    }
+    return {
+        ext: language
+        for ext, language in by_suffix.items()
+        if isinstance(language, cs.SupportedLanguage) and language in parsers
+    }
+
+
 class GraphUpdater:
     def __init__(
         self,
@@ -432,13 +653,18 @@ class GraphUpdater:
         self.project_name = (
             project_name and project_name.strip()
         ) or repo_path.resolve().name
-        self.simple_name_lookup: SimpleNameLookup = defaultdict(set)
+        self.simple_name_lookup = SimpleNameIndex()
         self.function_registry = FunctionRegistryTrie(
             simple_name_lookup=self.simple_name_lookup
         )
         self.ast_cache = BoundedASTCache()
+        self.incremental_parser = IncrementalParser()
         self.unignore_paths = unignore_paths
         self.exclude_paths = exclude_paths
+        self._ignored_dir_names = (
+            cs.IGNORE_PATTERNS | exclude_paths if exclude_paths else cs.IGNORE_PATTERNS
+        )
+        self._suffix_to_language = _parseable_suffixes(parsers)
         self.skipped_because_in_sync = False
         self._collected_dir_mtimes: DirMtimesCache = {}
         self._cpp_frontend_covered: frozenset[str] = frozenset()
@@ -454,6 +680,12 @@ class GraphUpdater:
             unignore_paths=self.unignore_paths,
             exclude_paths=self.exclude_paths,
         )
+        self.ast_cache.on_evict = self._drop_evicted_captures
+
+    def _drop_evicted_captures(self, file_path: Path) -> None:
+        # (H) Cached captures hold Nodes, and each Node pins its whole Tree, so
+        # (H) they must go with the tree for the cache bound to bound memory.
+        self.factory._func_class_captures_cache.pop(file_path, None)
 
     def _run_cpp_frontend(self) -> None:
         # (H) Optional libclang C++ pre-pass: when CPP_FRONTEND=libclang and a
@@ -542,33 +774,39 @@ class GraphUpdater:
         logger.debug(ls.REMOVING_STATE, path=file_path)
 
         if file_path in self.ast_cache:
-            del self.ast_cache[file_path]
             logger.debug(ls.REMOVED_FROM_CACHE)
+        # (H) Unconditional: an evicted file is still tracked for the call pass.
+        del self.ast_cache[file_path]
+
+        # (H) Use the module QN recorded when the file was parsed; it already
+        # (H) reflects mod.rs and same-basename disambiguation, which a QN
+        # (H) rebuilt from the path would not.
+        module_qn_prefix = self.factory.file_path_to_module_qn.pop(file_path, None)
+        if module_qn_prefix is None:
+            relative_path = cached_relative_path(file_path, self.repo_path)
+            path_parts = (
+                relative_path.parent.parts
+                if file_path.name == cs.INIT_PY
+                else relative_path.with_suffix("").parts
+            )
+            module_qn_prefix = cs.SEPARATOR_DOT.join([self.project_name, *path_parts])
 
-        relative_path = cached_relative_path(file_path, self.repo_path)
-        path_parts = (
-            relative_path.parent.parts
-            if file_path.name == cs.INIT_PY
-            else relative_path.with_suffix("").parts
-        )
-        module_qn_prefix = cs.SEPARATOR_DOT.join([self.project_name, *path_parts])
+        # (H) find_with_prefix returns a fresh list, so deleting while walking
+        # (H) it is safe.
+        entries_to_remove = self.function_registry.find_with_prefix(module_qn_prefix)
 
-        qns_to_remove = set()
+        if entries_to_remove:
+            logger.debug(ls.REMOVING_QNS, count=len(entries_to_remove))
 
-        for qn in list(self.function_registry.keys()):
-            if qn.startswith(f"{module_qn_prefix}.") or qn == module_qn_prefix:
-                qns_to_remove.add(qn)
-                del self.function_registry[qn]
+        for qn, _ in entries_to_remove:
+            del self.function_registry[qn]
+            for simple_name in self.simple_name_lookup.discard_qn(qn):
+                logger.debug(ls.CLEANED_SIMPLE_NAME, name=simple_name)
 
-        if qns_to_remove:
-            logger.debug(ls.REMOVING_QNS, count=len(qns_to_remove))
+        self.factory.call_processor.forget_callable_field_sites(file_path)
 
-        for simple_name, qn_set in self.simple_name_lookup.items():
-            original_count = len(qn_set)
-            new_qn_set = qn_set - qns_to_remove
-            if len(new_qn_set) < original_count:
-                self.simple_name_lookup[simple_name] = new_qn_set
-                logger.debug(ls.CLEANED_SIMPLE_NAME, name=simple_name)
+    def forget_parsed_tree(self, file_path: Path) -> None:
+        self.incremental_parser.forget(file_path)
 
     def _delete_module_entities(self, file_key: str) -> None:
         """Remove a changed/deleted file's Module subtree from the graph.
@@ -661,9 +899,7 @@ class GraphUpdater:
         return None, None
 
     def _should_keep_dir(self, dirname: str, dir_prefix: str) -> bool:
-        if dirname not in cs.IGNORE_PATTERNS and (
-            not self.exclude_paths or dirname not in self.exclude_paths
-        ):
+        if dirname not in self._ignored_dir_names:
             return True
         return bool(
             self.unignore_paths
@@ -729,36 +965,46 @@ class GraphUpdater:
             return []
 
         eligible: list[tuple[Path, str]] = []
-        hash_name = cs.HASH_CACHE_FILENAME
-        dir_mtimes_name = cs.DIR_MTIMES_FILENAME
-        repo_str = str(self.repo_path)
-        repo_prefix_len = len(repo_str) + 1
+        skip_names = (cs.HASH_CACHE_FILENAME, cs.DIR_MTIMES_FILENAME)
         exclude_paths = self.exclude_paths
         unignore_paths = self.unignore_paths
-        self._collected_dir_mtimes = {}
-        for dirpath, dirnames, filenames in os.walk(repo_str):
-            if len(dirpath) < repo_prefix_len:
-                rel_dir = ""
-                dir_parts: tuple[str, ...] = ()
-                dir_key = cs.ROOT_DIR_KEY
-            else:
-                rel_dir = dirpath[repo_prefix_len:].replace(os.sep, "/")
-                dir_parts = tuple(rel_dir.split("/")) if rel_dir else ()
-                dir_key = rel_dir or cs.ROOT_DIR_KEY
+        should_keep_dir = self._should_keep_dir
+        dir_mtimes: DirMtimesCache = {}
+        self._collected_dir_mtimes = dir_mtimes
+        append = eligible.append
+        # (H) Keeps the sorted pre-order os.walk produced.
+        stack: list[tuple[str, str]] = [(str(self.repo_path), "")]
+        while stack:
+            dirpath, rel_dir = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = sorted(it, key=_entry_name)
+            except OSError:
+                continue
+            dir_parts = tuple(rel_dir.split("/")) if rel_dir else ()
             dir_prefix = f"{rel_dir}/" if rel_dir else ""
             try:
-                self._collected_dir_mtimes[dir_key] = os.stat(dirpath).st_mtime
+                dir_mtimes[rel_dir or cs.ROOT_DIR_KEY] = os.stat(dirpath).st_mtime
             except OSError:
                 pass
-            dirnames[:] = sorted(
-                d for d in dirnames if self._should_keep_dir(d, dir_prefix)
-            )
-            for fname in sorted(filenames):
-                if fname in (hash_name, dir_mtimes_name):
+            subdirs: list[tuple[str, str]] = []
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # (H) Like os.walk(followlinks=False): symlinked dirs are
+                    # (H) never descended into.
+                    if not entry.is_symlink() and should_keep_dir(name, dir_prefix):
+                        subdirs.append((entry.path, f"{dir_prefix}{name}"))
+                    continue
+                if name in skip_names:
                     continue
-                dot = fname.rfind(".")
-                suffix = fname[dot:] if dot != -1 else ""
-                rel_path_str = f"{dir_prefix}{fname}"
+                dot = name.rfind(".")
+                suffix = name[dot:] if dot != -1 else ""
+                rel_path_str = f"{dir_prefix}{name}"
                 if not should_skip_rel_file(
                     rel_path_str,
                     dir_parts,
@@ -766,7 +1012,8 @@ class GraphUpdater:
                     exclude_paths=exclude_paths,
                     unignore_paths=unignore_paths,
                 ):
-                    eligible.append((Path(f"{dirpath}/{fname}"), rel_path_str))
+                    append((Path(entry.path), rel_path_str))
+            stack.extend(reversed(subdirs))
         return eligible
 
     def _process_files(self, force: bool = False) -> None:
@@ -829,8 +1076,6 @@ class GraphUpdater:
                 logger.debug(ls.FILE_HASH_NEW, path=file_key)
             changed_entries.append((filepath, file_key, is_new, file_bytes))
 
-        pre_parsed = self._pre_parse_changed_files(changed_entries)
-
         with Progress(
             SpinnerColumn(),
             TextColumn(ls.PROGRESS_INDEXING_LABEL),
@@ -842,29 +1087,47 @@ class GraphUpdater:
             if skipped_count or unreadable_count:
                 progress.advance(task, skipped_count + unreadable_count)
 
-            for filepath, file_key, is_new, file_bytes in changed_entries:
-                if not is_new:
-                    self.remove_file_from_state(filepath)
-                    self._delete_module_entities(file_key)
-
-                changed_count += 1
-                self._process_single_file(
-                    filepath,
-                    file_bytes=file_bytes,
-                    pre_parsed=pre_parsed.get(filepath),
-                )
-
-                processed_since_flush += 1
-                if processed_since_flush >= settings.FILE_FLUSH_INTERVAL:
-                    logger.info(ls.PERIODIC_FLUSH.format(count=processed_since_flush))
-                    self.ingestor.flush_all()
-                    processed_since_flush = 0
+            remove_file_from_state = self.remove_file_from_state
+            delete_module_entities = self._delete_module_entities
+            process_single_file = self._process_single_file
+            pre_parse_window = self._pre_parse_changed_files
+            flush_all = self.ingestor.flush_all
+            flush_interval = settings.FILE_FLUSH_INTERVAL
+            update_progress = progress.update
+
+            # (H) Pre-parsed captures pin their trees, so parse one flush
+            # (H) window at a time; the AST cache bound only holds if trees
+            # (H) it evicts are not still referenced from here.
+            for start in range(0, len(changed_entries), flush_interval):
+                window = changed_entries[start : start + flush_interval]
+                pre_parsed = pre_parse_window(window)
+                for filepath, file_key, is_new, file_bytes in window:
+                    if not is_new:
+                        remove_file_from_state(filepath)
+                        delete_module_entities(file_key)
+
+                    changed_count += 1
+                    process_single_file(
+                        filepath,
+                        file_bytes=file_bytes,
+                        pre_parsed=pre_parsed.pop(filepath, None),
+                    )
 
-                progress.update(
-                    task,
-                    advance=1,
-                    description=ls.PROGRESS_FILES_PROCESSED.format(count=changed_count),
-                )
+                    processed_since_flush += 1
+                    if processed_since_flush >= flush_interval:
+                        logger.info(
+                            ls.PERIODIC_FLUSH.format(count=processed_since_flush)
+                        )
+                        flush_all()
+                        processed_since_flush = 0
+
+                    update_progress(
+                        task,
+                        advance=1,
+                        description=ls.PROGRESS_FILES_PROCESSED.format(
+                            count=changed_count
+                        ),
+                    )
 
         deleted_keys = set(old_hashes.keys()) - current_file_keys
         if deleted_keys:
@@ -872,6 +1135,7 @@ class GraphUpdater:
             for deleted_key in deleted_keys:
                 deleted_path = self.repo_path / deleted_key
                 self.remove_file_from_state(deleted_path)
+                self.forget_parsed_tree(deleted_path)
                 self._delete_module_entities(deleted_key)
                 if isinstance(self.ingestor, QueryProtocol):
                     self.ingestor.execute_write(
@@ -892,28 +1156,47 @@ class GraphUpdater:
         self,
         changed_entries: list[tuple[Path, str, bool, bytes]],
     ) -> dict[Path, tuple[Node, dict[str, list] | None]]:
-        result: dict[Path, tuple[Node, dict[str, list] | None]] = {}
+        jobs: list[ParseJob] = []
+        job_languages: list[cs.SupportedLanguage] = []
         for filepath, _file_key, _is_new, file_bytes in changed_entries:
-            lang_config = get_language_spec(filepath.suffix)
-            if not (
-                lang_config
-                and isinstance(lang_config.language, cs.SupportedLanguage)
-                and lang_config.language in self.parsers
-            ):
+            language = self._suffix_to_language.get(filepath.suffix)
+            if language is None:
                 continue
-            language = lang_config.language
-            parser = self.queries[language].get(cs.KEY_PARSER)
-            if not parser:
+            parser = self.queries[language][cs.KEY_PARSER]
+            if parser.language is None:
                 continue
-            tree = parser.parse(file_bytes)
-            root_node = tree.root_node
-            combined_query = COMBINED_FUNC_CLASS_IMPORT_QUERIES.get(language)
-            combined_captures: dict[str, list] | None = None
-            if combined_query:
-                cursor = QueryCursor(combined_query)
-                combined_captures = sorted_captures(cursor, root_node)
-            result[filepath] = (root_node, combined_captures)
-        return result
+            jobs.append(ParseJob(filepath, parser.language, file_bytes))
+            job_languages.append(language)
+
+        trees = self.incremental_parser.parse_batch(
+            jobs, settings.PARSE_THREAD_POOL_SIZE
+        )
+        # (H) Query captures build Python Node objects and stay on this thread.
+        return {
+            job.path: self._capture_definitions(tree.root_node, language)
+            for job, language, tree in zip(jobs, job_languages, trees, strict=True)
+        }
+
+    @staticmethod
+    def _capture_definitions(
+        root_node: Node, language: cs.SupportedLanguage
+    ) -> tuple[Node, dict[str, list] | None]:
+        combined_query = COMBINED_FUNC_CLASS_IMPORT_QUERIES.get(language)
+        combined_captures: dict[str, list] | None = None
+        if combined_query:
+            cursor = QueryCursor(combined_query)
+            combined_captures = sorted_captures(cursor, root_node)
+        return root_node, combined_captures
+
+    def pre_parse_file(
+        self, filepath: Path, file_bytes: bytes
+    ) -> tuple[Node, dict[str, list] | None] | None:
+        language = self._suffix_to_language.get(filepath.suffix)
+        if language is None:
+            return None
+        parser = self.queries[language][cs.KEY_PARSER]
+        tree = self.incremental_parser.parse(parser, filepath, file_bytes)
+        return self._capture_definitions(tree.root_node, language)
 
     def _process_single_file(
         self,
@@ -931,54 +1214,87 @@ class GraphUpdater:
                 )
                 return
 
-        lang_config = get_language_spec(filepath.suffix)
-        if (
-            lang_config
-            and isinstance(lang_config.language, cs.SupportedLanguage)
-            and lang_config.language in self.parsers
-        ):
-            result = self.factory.definition_processor.process_file(
+        factory = self.factory
+        structure_processor = factory.structure_processor
+        file_name = filepath.name
+        language = self._suffix_to_language.get(filepath.suffix)
+        if language is not None:
+            result = factory.definition_processor.process_file(
                 filepath,
-                lang_config.language,
+                language,
                 self.queries,
-                self.factory.structure_processor.structural_elements,
+                structure_processor.structural_elements,
                 source_bytes=file_bytes,
                 pre_parsed=pre_parsed,
             )
             if result:
-                root_node, language = result
-                self.ast_cache[filepath] = (root_node, language)
-        elif self._is_dependency_file(filepath.name, filepath):
-            self.factory.definition_processor.process_dependencies(filepath)
+                self._record_parsed_file(filepath, result)
+        elif self._is_dependency_file(file_name, filepath):
+            factory.definition_processor.process_dependencies(filepath)
+
+        structure_processor.process_generic_file(filepath, file_name)
 
-        self.factory.structure_processor.process_generic_file(filepath, filepath.name)
+    def _record_parsed_file(
+        self, filepath: Path, result: tuple[Node, cs.SupportedLanguage]
+    ) -> None:
+        root_node, language = result
+        self.ast_cache[filepath] = result
+        self.factory.call_processor.collect_callable_field_sites(
+            filepath,
+            root_node,
+            language,
+            self.queries,
+            func_class_captures_cache=self.factory._func_class_captures_cache,
+        )
 
     def _process_function_calls(self) -> None:
+        call_processor = self.factory.call_processor
         captures_cache = self.factory._func_class_captures_cache
-        ast_cache_items = list(self.ast_cache.items())
-        for file_path, (root_node, language) in ast_cache_items:
-            self.factory.call_processor.collect_callable_field_bindings(
-                file_path,
-                root_node,
-                language,
-                self.queries,
-                func_class_captures_cache=captures_cache,
-            )
-        for file_path, (root_node, language) in ast_cache_items:
+        queries = self.queries
+        call_sources = list(self.ast_cache.languages.items())
+        root_for = self._call_pass_root
+        call_processor.resolve_callable_field_bindings()
+        process_calls = call_processor.process_calls_in_file
+        flush_all = self.ingestor.flush_all
+        flush_interval = settings.FILE_FLUSH_INTERVAL
+        capture_call = cs.CAPTURE_CALL
+        capture_function = cs.CAPTURE_FUNCTION
+        processed_since_flush = 0
+        for file_path, language in call_sources:
             if captures_cache is not None and file_path in captures_cache:
                 cached = captures_cache[file_path]
-                if not cached.get(cs.CAPTURE_CALL) and not cached.get(
-                    cs.CAPTURE_FUNCTION
-                ):
+                if not cached.get(capture_call) and not cached.get(capture_function):
                     continue
-            self.factory.call_processor.process_calls_in_file(
+            if (root_node := root_for(file_path, language)) is None:
+                continue
+            process_calls(
                 file_path,
                 root_node,
                 language,
-                self.queries,
+                queries,
                 func_class_captures_cache=captures_cache,
             )
-        self.factory.call_processor.finalize_callable_param_flow()
+            processed_since_flush += 1
+            if processed_since_flush >= flush_interval:
+                logger.info(ls.PERIODIC_CALLS_FLUSH.format(count=processed_since_flush))
+                flush_all()
+                processed_since_flush = 0
+        call_processor.finalize_callable_param_flow()
+
+    def _call_pass_root(
+        self, file_path: Path, language: cs.SupportedLanguage
+    ) -> Node | None:
+        if file_path in self.ast_cache:
+            return self.ast_cache[file_path][0]
+        parser = self.queries[language][cs.KEY_PARSER]
+        try:
+            file_bytes = file_path.read_bytes()
+        except OSError as e:
+            logger.warning(ls.FILE_UNREADABLE, path=file_path, error=e)
+            return None
+        # (H) Not stored back into the AST cache: pass 3 walks files oldest
+        # (H) first, so re-inserting would evict the trees it needs next.
+        return self.incremental_parser.parse(parser, file_path, file_bytes).root_node
 
     def _prune_orphan_nodes(self) -> None:
         """Remove graph nodes whose files/folders no longer exist on disk."""
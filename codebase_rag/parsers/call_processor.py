@@ -64,6 +64,7 @@ class CallProcessor:
         "_resolver",
         "_flow_param_names",
         "_flow_args",
+        "_callable_field_sites",
     )
 
     def __init__(
@@ -90,6 +91,9 @@ class CallProcessor:
         # (H) the per-call-site argument bindings, resolved to a fixpoint in finalize.
         self._flow_param_names: dict[str, list[str]] = {}
         self._flow_args: list[_CallableFlowArg] = []
+        self._callable_field_sites: dict[
+            Path, tuple[str, list[tuple[str, tuple[tuple[str, str], ...]]]]
+        ] = {}
 
     def _get_node_name(self, node: Node, field: str = cs.FIELD_NAME) -> str | None:
         name_node = node.child_by_field_name(field)
@@ -226,7 +230,7 @@ class CallProcessor:
             [self.project_name] + list(relative_path.with_suffix("").parts)
         )
 
-    def collect_callable_field_bindings(
+    def collect_callable_field_sites(
         self,
         file_path: Path,
         root_node: Node,
@@ -234,17 +238,16 @@ class CallProcessor:
         queries: dict[cs.SupportedLanguage, LanguageQueries],
         func_class_captures_cache: dict[Path, dict] | None = None,
     ) -> None:
-        # (H) Pre-pass: record which functions are bound to a class's callable
-        # (H) fields (FQNSpec(get_name=_python_get_name, ...)). Runs before call
-        # (H) resolution so a field invocation can resolve regardless of which
-        # (H) file the construction site lives in. Keyword bindings only;
-        # (H) positional callable args would need declared field order.
+        # (H) Runs in the definition pass while the tree is in hand and keeps
+        # (H) only the text of keyword call sites; they are resolved once the
+        # (H) registry is complete, so the call pass never re-parses for them.
         if language != cs.SupportedLanguage.PYTHON:
             return
+        module_qn = self._module_qn(
+            cached_relative_path(file_path, self.repo_path), file_path.name
+        )
+        sites: list[tuple[str, tuple[tuple[str, str], ...]]] = []
         try:
-            module_qn = self._module_qn(
-                cached_relative_path(file_path, self.repo_path), file_path.name
-            )
             if (
                 func_class_captures_cache is not None
                 and file_path in func_class_captures_cache
@@ -256,9 +259,6 @@ class CallProcessor:
                 call_nodes, _ = self._collect_all_call_nodes(
                     root_node, language, queries
                 )
-            resolver = self._resolver
-            registry = resolver.function_registry
-            callable_labels = (cs.NodeLabel.FUNCTION, cs.NodeLabel.METHOD)
             for call_node in call_nodes:
                 _positional, keyword = self._parse_call_arguments(call_node)
                 if not keyword:
@@ -266,19 +266,51 @@ class CallProcessor:
                 name = self._get_call_target_name(call_node)
                 if not name:
                     continue
-                callee = resolver.resolve_function_call(name, module_qn)
-                if not callee or callee[0] != cs.NodeLabel.CLASS:
-                    continue
-                for field, value_node in keyword.items():
-                    if not (value_text := safe_decode_text(value_node)):
-                        continue
-                    bound = resolver.resolve_function_call(value_text, module_qn)
-                    if bound and bound[0] in callable_labels and bound[1] in registry:
-                        resolver.record_callable_field_binding(
-                            callee[1], field, bound[1]
-                        )
+                fields = tuple(
+                    (field, value_text)
+                    for field, value_node in keyword.items()
+                    if (value_text := safe_decode_text(value_node))
+                )
+                if fields:
+                    sites.append((name, fields))
         except Exception as e:
             logger.error(ls.CALL_PROCESSING_FAILED, path=file_path, error=e)
+            sites = []
+        if sites:
+            self._callable_field_sites[file_path] = (module_qn, sites)
+        else:
+            self._callable_field_sites.pop(file_path, None)
+
+    def forget_callable_field_sites(self, file_path: Path) -> None:
+        self._callable_field_sites.pop(file_path, None)
+
+    def resolve_callable_field_bindings(self) -> None:
+        # (H) Record which functions are bound to a class's callable fields
+        # (H) (FQNSpec(get_name=_python_get_name, ...)). Runs before call
+        # (H) resolution so a field invocation can resolve regardless of which
+        # (H) file the construction site lives in. Keyword bindings only;
+        # (H) positional callable args would need declared field order.
+        resolver = self._resolver
+        registry = resolver.function_registry
+        callable_labels = (cs.NodeLabel.FUNCTION, cs.NodeLabel.METHOD)
+        for file_path, (module_qn, sites) in self._callable_field_sites.items():
+            try:
+                for name, fields in sites:
+                    callee = resolver.resolve_function_call(name, module_qn)
+                    if not callee or callee[0] != cs.NodeLabel.CLASS:
+                        continue
+                    for field, value_text in fields:
+                        bound = resolver.resolve_function_call(value_text, module_qn)
+                        if (
+                            bound
+                            and bound[0] in callable_labels
+                            and bound[1] in registry
+                        ):
+                            resolver.record_callable_field_binding(
+                                callee[1], field, bound[1]
+                            )
+            except Exception as e:
+                logger.error(ls.CALL_PROCESSING_FAILED, path=file_path, error=e)
 
     def process_calls_in_file(
         self,
@@ -21,22 +21,19 @@ def process_all_method_overrides(
 ) -> None:
     logger.info(logs.CLASS_PASS_4)
 
-    for method_qn in function_registry.keys():
-        if (
-            function_registry[method_qn] == NodeType.METHOD
-            and cs.SEPARATOR_DOT in method_qn
-        ):
-            parts = method_qn.rsplit(cs.SEPARATOR_DOT, 1)
-            if len(parts) == 2:
-                class_qn, method_name = parts
-                check_method_overrides(
-                    method_qn,
-                    method_name,
-                    class_qn,
-                    function_registry,
-                    class_inheritance,
-                    ingestor,
-                )
+    for method_qn, node_type in function_registry.items():
+        if node_type != NodeType.METHOD:
+            continue
+        class_qn, sep, method_name = method_qn.rpartition(cs.SEPARATOR_DOT)
+        if sep and class_qn in class_inheritance:
+            check_method_overrides(
+                method_qn,
+                method_name,
+                class_qn,
+                function_registry,
+                class_inheritance,
+                ingestor,
+            )
 
 
 def check_method_overrides(
@@ -282,13 +282,16 @@ class _Collector:
             return (cs.NodeLabel.FOLDER, cs.KEY_PATH, parent_rel.as_posix())
         return (cs.NodeLabel.PROJECT, cs.KEY_NAME, self.resolver.project_name)
 
-    def _register(self, label: str, props: PropertyDict) -> None:
-        if self.function_registry is None:
-            return
+    def _register(
+        self,
+        label: str,
+        props: PropertyDict,
+        registrations: list[tuple[str, NodeType]],
+    ) -> None:
         qn = props[cs.KEY_QUALIFIED_NAME]
         if not isinstance(qn, str):
             return
-        self.function_registry[qn] = NodeType(label)
+        registrations.append((qn, NodeType(label)))
         name = props[cs.KEY_NAME]
         if self.simple_name_lookup is not None and isinstance(name, str):
             self.simple_name_lookup[name].add(qn)
@@ -303,9 +306,13 @@ class _Collector:
                     cs.RelationshipType.CONTAINS_MODULE,
                     (fc.LABEL_MODULE, cs.KEY_QUALIFIED_NAME, module_qn),
                 )
+        registrations: list[tuple[str, NodeType]] = []
         for label, props, _ in self.nodes.values():
             ingestor.ensure_node_batch(label, props)
-            self._register(label, props)
+            if self.function_registry is not None:
+                self._register(label, props, registrations)
+        if self.function_registry is not None and registrations:
+            self.function_registry.bulk_insert(registrations)
         for rel_type, from_label, from_qn, to_label, to_qn in self.edges:
             ingestor.ensure_relationship_batch(
                 (from_label, cs.KEY_QUALIFIED_NAME, from_qn),
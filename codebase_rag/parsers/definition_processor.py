@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -42,6 +43,7 @@ class DefinitionProcessor(
         import_processor: ImportProcessor,
         module_qn_to_file_path: dict[str, Path],
         func_class_captures_cache: dict[Path, dict] | None = None,
+        file_path_to_module_qn: dict[Path, str] | None = None,
     ):
         super().__init__()
         self.ingestor = ingestor
@@ -51,6 +53,9 @@ class DefinitionProcessor(
         self.simple_name_lookup = simple_name_lookup
         self.import_processor = import_processor
         self.module_qn_to_file_path = module_qn_to_file_path
+        self.file_path_to_module_qn = (
+            file_path_to_module_qn if file_path_to_module_qn is not None else {}
+        )
         self.class_inheritance: dict[str, list[str]] = {}
         self._deferred_cpp_methods: list = []
         self._deferred_go_methods: list = []
@@ -117,8 +122,9 @@ class DefinitionProcessor(
                 module_qn = cs.SEPARATOR_DOT.join(
                     [self.project_name] + list(relative_path.parent.parts)
                 )
-            module_qn = self._disambiguate_module_qn(module_qn, file_path)
+            module_qn = sys.intern(self._disambiguate_module_qn(module_qn, file_path))
             self.module_qn_to_file_path[module_qn] = file_path
+            self.file_path_to_module_qn[file_path] = module_qn
 
             self.ingestor.ensure_node_batch(
                 cs.NodeLabel.MODULE,
@@ -27,6 +27,7 @@ class ProcessorFactory:
         "unignore_paths",
         "exclude_paths",
         "module_qn_to_file_path",
+        "file_path_to_module_qn",
         "_import_processor",
         "_structure_processor",
         "_definition_processor",
@@ -58,6 +59,7 @@ class ProcessorFactory:
         self.exclude_paths = exclude_paths
 
         self.module_qn_to_file_path: dict[str, Path] = {}
+        self.file_path_to_module_qn: dict[Path, str] = {}
         self._func_class_captures_cache: dict[Path, dict] = {}
 
         self._import_processor: ImportProcessor | None = None
@@ -102,6 +104,7 @@ class ProcessorFactory:
                 import_processor=self.import_processor,
                 module_qn_to_file_path=self.module_qn_to_file_path,
                 func_class_captures_cache=self._func_class_captures_cache,
+                file_path_to_module_qn=self.file_path_to_module_qn,
             )
         return self._definition_processor
 
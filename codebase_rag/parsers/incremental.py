@@ -0,0 +1,166 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from tree_sitter import Language, Parser, Point, Tree
+
+from ..config import settings
+
+_PREFIX_CHUNK_SIZE = 4096
+
+
+class TreeEdit(NamedTuple):
+    start_byte: int
+    old_end_byte: int
+    new_end_byte: int
+    start_point: Point
+    old_end_point: Point
+    new_end_point: Point
+
+
+def byte_to_point(source: bytes, offset: int) -> Point:
+    row = source.count(b"\n", 0, offset)
+    line_start = source.rfind(b"\n", 0, offset) + 1
+    return Point(row, offset - line_start)
+
+
+def _common_prefix_len(old: bytes, new: memoryview, limit: int) -> int:
+    start = 0
+    while start < limit:
+        end = min(start + _PREFIX_CHUNK_SIZE, limit)
+        if not old.startswith(new[start:end], start):
+            lo, hi = start, end
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if old.startswith(new[lo:mid], lo):
+                    lo = mid
+                else:
+                    hi = mid
+            return lo
+        start = end
+    return limit
+
+
+def _common_suffix_len(old: bytes, new: memoryview, limit: int) -> int:
+    old_len = len(old)
+    new_len = len(new)
+    matched = 0
+    while matched < limit:
+        step = min(_PREFIX_CHUNK_SIZE, limit - matched)
+        if not old.startswith(
+            new[new_len - matched - step : new_len - matched],
+            old_len - matched - step,
+        ):
+            lo, hi = matched, matched + step
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if old.startswith(new[new_len - mid : new_len - lo], old_len - mid):
+                    lo = mid
+                else:
+                    hi = mid
+            return lo
+        matched += step
+    return limit
+
+
+def compute_tree_edit(old_bytes: bytes, new_bytes: bytes) -> TreeEdit | None:
+    if old_bytes == new_bytes:
+        return None
+    shortest = min(len(old_bytes), len(new_bytes))
+    with memoryview(new_bytes) as new_view:
+        prefix = _common_prefix_len(old_bytes, new_view, shortest)
+        suffix = _common_suffix_len(old_bytes, new_view, shortest - prefix)
+    old_end = len(old_bytes) - suffix
+    new_end = len(new_bytes) - suffix
+    return TreeEdit(
+        start_byte=prefix,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=byte_to_point(new_bytes, prefix),
+        old_end_point=byte_to_point(old_bytes, old_end),
+        new_end_point=byte_to_point(new_bytes, new_end),
+    )
+
+
+def reparse(parser: Parser, new_bytes: bytes, old_bytes: bytes, old_tree: Tree) -> Tree:
+    edit = compute_tree_edit(old_bytes, new_bytes)
+    if edit is None:
+        return old_tree
+    # (H) Edit a copy so nodes still referenced from the AST cache keep
+    # (H) positions that match the source they were parsed from.
+    edited = old_tree.copy()
+    edited.edit(**edit._asdict())
+    return parser.parse(new_bytes, edited)
+
+
+class ParseJob(NamedTuple):
+    path: Path
+    language: Language
+    source: bytes
+
+
+class IncrementalParser:
+    __slots__ = ("trees", "max_entries", "_local")
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self.trees: OrderedDict[Path, tuple[Tree, bytes]] = OrderedDict()
+        self.max_entries = (
+            max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
+        )
+        self._local = threading.local()
+
+    def parse(self, parser: Parser, path: Path, new_bytes: bytes) -> Tree:
+        tree = self._parse_with(parser, self.trees.get(path), new_bytes)
+        self._store(path, tree, new_bytes)
+        return tree
+
+    def parse_batch(self, jobs: list[ParseJob], max_workers: int) -> list[Tree]:
+        # (H) Parsers are not thread-safe, hence one per (thread, language);
+        # (H) the cache is only touched on this thread.
+        previous = [self.trees.get(job.path) for job in jobs]
+        if max_workers <= 1 or len(jobs) <= 1:
+            trees = [
+                self._parse_job(job, cached)
+                for job, cached in zip(jobs, previous, strict=True)
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                trees = list(executor.map(self._parse_job, jobs, previous))
+        for job, tree in zip(jobs, trees, strict=True):
+            self._store(job.path, tree, job.source)
+        return trees
+
+    def _parse_job(self, job: ParseJob, cached: tuple[Tree, bytes] | None) -> Tree:
+        parsers: dict[Language, Parser] | None = getattr(self._local, "parsers", None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(job.language)
+        if parser is None:
+            parser = parsers[job.language] = Parser(job.language)
+        return self._parse_with(parser, cached, job.source)
+
+    @staticmethod
+    def _parse_with(
+        parser: Parser, cached: tuple[Tree, bytes] | None, new_bytes: bytes
+    ) -> Tree:
+        if cached is None:
+            return parser.parse(new_bytes)
+        old_tree, old_bytes = cached
+        return reparse(parser, new_bytes, old_bytes, old_tree)
+
+    def _store(self, path: Path, tree: Tree, source: bytes) -> None:
+        self.trees.pop(path, None)
+        self.trees[path] = (tree, source)
+        while len(self.trees) > self.max_entries:
+            self.trees.popitem(last=False)
+
+    def forget(self, path: Path) -> None:
+        self.trees.pop(path, None)
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self.trees
+
+    def __len__(self) -> int:
+        return len(self.trees)
@@ -5,16 +5,20 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from codebase_rag import constants as cs
+from codebase_rag.config import settings
 from codebase_rag.graph_updater import (
     BoundedASTCache,
     FunctionRegistryTrie,
     GraphUpdater,
+    SimpleNameIndex,
     _hash_file,
     _hash_file_with_bytes,
     _load_hash_cache,
     _save_hash_cache,
 )
 from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.incremental import IncrementalParser
+from codebase_rag.types_defs import NodeType
 
 
 @pytest.fixture
@@ -443,6 +447,336 @@ class TestFastPathInSync:
             spy_calls.assert_called_once()
 
 
+class TestRemoveFileFromState:
+    def test_removes_only_the_files_qns(self, updater: GraphUpdater) -> None:
+        project = updater.project_name
+        registry = updater.function_registry
+        registry[f"{project}.pkg.mod.Cls"] = NodeType.CLASS
+        registry[f"{project}.pkg.mod.Cls.method"] = NodeType.METHOD
+        registry[f"{project}.pkg.mod_other.helper"] = NodeType.FUNCTION
+        registry[f"{project}.pkg.modx.helper"] = NodeType.FUNCTION
+
+        updater.remove_file_from_state(updater.repo_path / "pkg" / "mod.py")
+
+        assert set(registry.keys()) == {
+            f"{project}.pkg.mod_other.helper",
+            f"{project}.pkg.modx.helper",
+        }
+        assert updater.simple_name_lookup["method"] == set()
+        assert updater.simple_name_lookup["helper"] == {
+            f"{project}.pkg.mod_other.helper",
+            f"{project}.pkg.modx.helper",
+        }
+
+    def test_cleans_simple_names_not_derived_from_qn(
+        self, updater: GraphUpdater
+    ) -> None:
+        project = updater.project_name
+        ctor_qn = f"{project}.Shape.Shape.Shape(String)"
+        updater.function_registry[ctor_qn] = NodeType.METHOD
+        updater.simple_name_lookup["Shape"].add(ctor_qn)
+
+        updater.remove_file_from_state(updater.repo_path / "Shape.java")
+
+        assert ctor_qn not in updater.function_registry
+        assert ctor_qn not in updater.simple_name_lookup["Shape"]
+        assert ctor_qn not in updater.simple_name_lookup.qn_to_names
+
+    def test_uses_module_qn_recorded_at_parse_time(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        (temp_repo / "util.js").write_text("function helper() {}\n")
+        (temp_repo / "util.py").write_text("def helper():\n    pass\n")
+        parsers, queries = load_parsers()
+        updater = GraphUpdater(
+            ingestor=mock_ingestor,
+            repo_path=temp_repo,
+            parsers=parsers,
+            queries=queries,
+        )
+        updater.run(force=True)
+        project = updater.project_name
+        py_module = updater.factory.file_path_to_module_qn[temp_repo / "util.py"]
+        assert py_module == f"{project}.util.py"
+
+        updater.remove_file_from_state(temp_repo / "util.py")
+
+        assert f"{project}.util.py.helper" not in updater.function_registry
+        assert f"{project}.util.helper" in updater.function_registry
+        assert temp_repo / "util.py" not in updater.factory.file_path_to_module_qn
+
+
+class TestSimpleNameIndex:
+    def test_records_reverse_mapping_on_add(self) -> None:
+        index = SimpleNameIndex()
+        index["run"].add("proj.a.run")
+        index["Runner"].add("proj.a.run")
+
+        index["run"].add("proj.b.run")
+
+        assert index.qn_to_names == {"proj.a.run": ("Runner",)}
+        assert index.discard_qn("proj.a.run") == {"run", "Runner"}
+        assert index.discard_qn("proj.b.run") == {"run"}
+        assert index["run"] == set()
+        assert index["Runner"] == set()
+        assert index.qn_to_names == {}
+
+    def test_bucket_deduplicates_and_supports_set_operations(self) -> None:
+        index = SimpleNameIndex()
+        index["run"].add("proj.a.run")
+        index["run"].update(["proj.a.run", "proj.b.run"])
+
+        assert list(index["run"]) == ["proj.a.run", "proj.b.run"]
+        assert len(index["run"]) == 2
+        assert index["run"] == {"proj.a.run", "proj.b.run"}
+        assert index["run"] | {"proj.c.run"} == {
+            "proj.a.run",
+            "proj.b.run",
+            "proj.c.run",
+        }
+        assert index["run"] - {"proj.a.run"} == {"proj.b.run"}
+
+    def test_large_bucket_keeps_order_and_deduplicates(self) -> None:
+        index = SimpleNameIndex()
+        qns = [f"proj.m{i}.Cls.__init__" for i in range(2000)]
+        for qn in qns:
+            index["__init__"].add(qn)
+            index["__init__"].add(qn)
+
+        bucket = index["__init__"]
+        assert len(bucket) == 2000
+        assert list(bucket) == qns
+        assert "proj.m1999.Cls.__init__" in bucket
+
+        for qn in qns[::2]:
+            assert index.discard_qn(qn) == {"__init__"}
+
+        assert list(bucket) == qns[1::2]
+        assert "proj.m0.Cls.__init__" not in bucket
+
+    def test_get_does_not_create_buckets(self) -> None:
+        index = SimpleNameIndex()
+        assert index.get("missing") is None
+        assert "missing" not in index
+
+
+class TestParseableSuffixes:
+    def test_only_languages_with_loaded_parsers(self, temp_repo: Path) -> None:
+        parsers, queries = load_parsers()
+        py_only = {cs.SupportedLanguage.PYTHON: parsers[cs.SupportedLanguage.PYTHON]}
+        updater = GraphUpdater(
+            ingestor=MagicMock(),
+            repo_path=temp_repo,
+            parsers=py_only,
+            queries=queries,
+        )
+        assert updater._suffix_to_language.get(".py") == cs.SupportedLanguage.PYTHON
+        assert ".rs" not in updater._suffix_to_language
+
+    def test_exclude_paths_join_ignored_dir_names(self, temp_repo: Path) -> None:
+        parsers, queries = load_parsers()
+        updater = GraphUpdater(
+            ingestor=MagicMock(),
+            repo_path=temp_repo,
+            parsers=parsers,
+            queries=queries,
+            exclude_paths=frozenset({"generated"}),
+        )
+        assert not updater._should_keep_dir("generated", "")
+        assert not updater._should_keep_dir("node_modules", "")
+        assert updater._should_keep_dir("src", "")
+
+
+class TestCollectEligibleFiles:
+    def test_lists_files_before_subdirs_and_skips_ignored(
+        self, updater: GraphUpdater
+    ) -> None:
+        repo = updater.repo_path
+        for rel in ("b/z.py", "b/a/x.py", "a.py", "c/y.py", "node_modules/m.js"):
+            (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+            (repo / rel).write_text("")
+        (repo / "linked").symlink_to(repo / "c", target_is_directory=True)
+        (repo / cs.HASH_CACHE_FILENAME).write_text("{}")
+
+        eligible = updater._collect_eligible_files()
+
+        assert [key for _, key in eligible] == ["a.py", "b/z.py", "b/a/x.py", "c/y.py"]
+        assert all(path == repo / key for path, key in eligible)
+        assert set(updater._collected_dir_mtimes) == {
+            cs.ROOT_DIR_KEY,
+            "b",
+            "b/a",
+            "c",
+        }
+
+
+class TestPeriodicFlush:
+    def test_call_pass_flushes_every_interval(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        for name in ("module_a", "module_b", "module_c"):
+            (temp_repo / f"{name}.py").write_text(
+                "def helper():\n    pass\n\n\ndef caller():\n    helper()\n"
+            )
+        parsers, queries = load_parsers()
+        updater = GraphUpdater(
+            ingestor=mock_ingestor,
+            repo_path=temp_repo,
+            parsers=parsers,
+            queries=queries,
+        )
+        updater.run(force=True)
+        mock_ingestor.flush_all.reset_mock()
+
+        with patch.object(settings, "FILE_FLUSH_INTERVAL", 2):
+            updater._process_function_calls()
+
+        assert mock_ingestor.flush_all.call_count == 1
+
+    def test_definition_pass_parses_one_window_at_a_time(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        names = [f"module_{i}" for i in range(5)]
+        for name in names:
+            (temp_repo / f"{name}.py").write_text("def func():\n    pass\n")
+        parsers, queries = load_parsers()
+        updater = GraphUpdater(
+            ingestor=mock_ingestor,
+            repo_path=temp_repo,
+            parsers=parsers,
+            queries=queries,
+        )
+
+        with (
+            patch.object(settings, "FILE_FLUSH_INTERVAL", 2),
+            patch.object(
+                IncrementalParser,
+                "parse_batch",
+                autospec=True,
+                side_effect=IncrementalParser.parse_batch,
+            ) as spy,
+        ):
+            updater.run(force=True)
+
+        assert [len(c.args[1]) for c in spy.call_args_list] == [2, 2, 1]
+        assert {temp_repo / f"{name}.py" for name in names} <= set(
+            updater.ast_cache.languages
+        )
+
+
+class TestCallPassAfterEviction:
+    def test_evicted_files_are_reparsed_for_calls(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        names = ("module_a", "module_b", "module_c")
+        for name in names:
+            (temp_repo / f"{name}.py").write_text(
+                "def helper():\n    pass\n\n\ndef caller():\n    helper()\n"
+            )
+        parsers, queries = load_parsers()
+        with patch.object(settings, "CACHE_MAX_ENTRIES", 1):
+            updater = GraphUpdater(
+                ingestor=mock_ingestor,
+                repo_path=temp_repo,
+                parsers=parsers,
+                queries=queries,
+            )
+            updater.run(force=True)
+
+        assert len(updater.ast_cache.cache) == 1
+        assert set(updater.factory._func_class_captures_cache) <= set(
+            updater.ast_cache.cache
+        )
+        callers = {
+            c.args[0][2]
+            for c in mock_ingestor.ensure_relationship_batch.call_args_list
+            if c.args[1] == cs.RelationshipType.CALLS
+        }
+        assert callers == {f"{updater.project_name}.{name}.caller" for name in names}
+
+    def test_evicted_files_are_parsed_once_per_call_pass(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        for name in ("module_a", "module_b", "module_c"):
+            (temp_repo / f"{name}.py").write_text(
+                "def helper():\n    pass\n\n\ndef caller():\n    helper()\n"
+            )
+        parsers, queries = load_parsers()
+        with patch.object(settings, "CACHE_MAX_ENTRIES", 1):
+            updater = GraphUpdater(
+                ingestor=mock_ingestor,
+                repo_path=temp_repo,
+                parsers=parsers,
+                queries=queries,
+            )
+            updater.run(force=True)
+
+            with patch.object(
+                IncrementalParser,
+                "parse",
+                autospec=True,
+                side_effect=IncrementalParser.parse,
+            ) as spy:
+                updater._process_function_calls()
+
+        parsed = [c.args[2] for c in spy.call_args_list]
+        evicted = set(updater.ast_cache.languages) - set(updater.ast_cache.cache)
+        assert len(evicted) == 2
+        assert sorted(parsed) == sorted(evicted)
+
+    def test_callable_field_binding_in_evicted_file(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        (temp_repo / "a_site.py").write_text(
+            "from z_spec import Spec\n\n\n"
+            "def handler():\n    return 1\n\n\n"
+            "SPEC = Spec(fetch_name=handler)\n"
+        )
+        (temp_repo / "z_spec.py").write_text(
+            "from typing import Callable, NamedTuple\n\n\n"
+            "class Spec(NamedTuple):\n    fetch_name: Callable[[], int]\n\n\n"
+            "def use(spec):\n    return spec.fetch_name()\n"
+        )
+        parsers, queries = load_parsers()
+        with patch.object(settings, "CACHE_MAX_ENTRIES", 1):
+            updater = GraphUpdater(
+                ingestor=mock_ingestor,
+                repo_path=temp_repo,
+                parsers=parsers,
+                queries=queries,
+            )
+            updater.run(force=True)
+
+        project = updater.project_name
+        calls = {
+            (c.args[0][2], c.args[2][2])
+            for c in mock_ingestor.ensure_relationship_batch.call_args_list
+            if c.args[1] == cs.RelationshipType.CALLS
+        }
+        assert (f"{project}.z_spec.use", f"{project}.a_site.handler") in calls
+
+    def test_removed_file_is_no_longer_tracked(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        for name in ("module_a", "module_b"):
+            (temp_repo / f"{name}.py").write_text("def func():\n    pass\n")
+        parsers, queries = load_parsers()
+        with patch.object(settings, "CACHE_MAX_ENTRIES", 1):
+            updater = GraphUpdater(
+                ingestor=mock_ingestor,
+                repo_path=temp_repo,
+                parsers=parsers,
+                queries=queries,
+            )
+            updater.run(force=True)
+
+        evicted = temp_repo / "module_a.py"
+        assert evicted not in updater.ast_cache
+        updater.remove_file_from_state(evicted)
+
+        assert evicted not in updater.ast_cache.languages
+
+
 class TestSlots:
     def test_function_registry_trie_has_slots(self) -> None:
         assert hasattr(FunctionRegistryTrie, "__slots__")
@@ -0,0 +1,208 @@
+import random
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from tree_sitter import Parser, Point
+
+from codebase_rag import constants as cs
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.incremental import (
+    IncrementalParser,
+    ParseJob,
+    byte_to_point,
+    compute_tree_edit,
+    reparse,
+)
+
+
+@pytest.fixture(scope="module")
+def py_parser() -> Parser:
+    _, queries = load_parsers()
+    parser = queries[cs.SupportedLanguage.PYTHON][cs.KEY_PARSER]
+    assert parser is not None
+    return parser
+
+
+SOURCE = b"def a():\n    return 1\n\n\ndef b():\n    pass\n" * 20
+
+
+class TestComputeTreeEdit:
+    def test_identical_bytes_yield_no_edit(self) -> None:
+        assert compute_tree_edit(SOURCE, SOURCE) is None
+
+    def test_edit_spans_only_changed_region(self) -> None:
+        new = SOURCE.replace(b"return 1", b"return 42", 1)
+        edit = compute_tree_edit(SOURCE, new)
+        assert edit is not None
+        assert edit.start_byte == SOURCE.index(b"1")
+        assert edit.old_end_byte == edit.start_byte + 1
+        assert edit.new_end_byte == edit.start_byte + 2
+        assert edit.start_point == Point(1, 11)
+
+    def test_prefix_and_suffix_do_not_overlap(self) -> None:
+        old = b"aaaa"
+        new = b"aaaaaa"
+        edit = compute_tree_edit(old, new)
+        assert edit is not None
+        assert edit.start_byte == 4
+        assert edit.old_end_byte == 4
+        assert edit.new_end_byte == 6
+
+    def test_edit_across_chunk_boundaries(self) -> None:
+        old = b"x" * 10_000 + b"y" * 10_000
+        new = b"x" * 10_000 + b"zz" + b"y" * 10_000
+        edit = compute_tree_edit(old, new)
+        assert edit is not None
+        assert edit.start_byte == 10_000
+        assert edit.old_end_byte == 10_000
+        assert edit.new_end_byte == 10_002
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_naive_prefix_and_suffix(self, seed: int) -> None:
+        rng = random.Random(seed)
+        old = bytes(rng.choice(b"ab\n") for _ in range(9_000))
+        start = rng.randrange(len(old))
+        end = rng.randrange(start, len(old))
+        new = old[:start] + bytes(rng.choice(b"abc") for _ in range(50)) + old[end:]
+
+        edit = compute_tree_edit(old, new)
+
+        assert edit is not None
+        prefix = next(
+            (i for i, (x, y) in enumerate(zip(old, new, strict=False)) if x != y),
+            min(len(old), len(new)),
+        )
+        assert edit.start_byte == prefix
+        assert old[edit.old_end_byte :] == new[edit.new_end_byte :]
+        assert edit.old_end_byte >= prefix
+        assert edit.new_end_byte >= prefix
+        if edit.old_end_byte > prefix and edit.new_end_byte > prefix:
+            assert old[edit.old_end_byte - 1] != new[edit.new_end_byte - 1]
+
+    def test_byte_to_point(self) -> None:
+        source = b"ab\ncde\nf"
+        assert byte_to_point(source, 0) == Point(0, 0)
+        assert byte_to_point(source, 4) == Point(1, 1)
+        assert byte_to_point(source, 8) == Point(2, 1)
+
+
+class TestReparse:
+    def test_matches_full_parse(self, py_parser: Parser) -> None:
+        old_tree = py_parser.parse(SOURCE)
+        new = SOURCE.replace(b"pass", b"x = 1\n    return x", 1) + b"c = 3\n"
+
+        tree = reparse(py_parser, new, SOURCE, old_tree)
+
+        assert str(tree.root_node) == str(py_parser.parse(new).root_node)
+        assert tree.root_node.text == new
+
+    def test_old_tree_is_left_untouched(self, py_parser: Parser) -> None:
+        old_tree = py_parser.parse(SOURCE)
+        reparse(py_parser, b"# header\n" + SOURCE, SOURCE, old_tree)
+        assert old_tree.root_node.end_byte == len(SOURCE)
+        assert old_tree.root_node.children[0].start_byte == 0
+
+
+class TestIncrementalParser:
+    def test_reuses_cached_tree(self, py_parser: Parser) -> None:
+        incremental = IncrementalParser()
+        path = Path("module.py")
+        incremental.parse(py_parser, path, SOURCE)
+        assert path in incremental
+
+        new = SOURCE + b"def c():\n    pass\n"
+        tree = incremental.parse(py_parser, path, new)
+
+        assert str(tree.root_node) == str(py_parser.parse(new).root_node)
+        assert incremental.trees[path][1] == new
+
+    def test_forget_drops_entry(self, py_parser: Parser) -> None:
+        incremental = IncrementalParser()
+        path = Path("module.py")
+        incremental.parse(py_parser, path, SOURCE)
+        incremental.forget(path)
+        assert path not in incremental
+
+    def test_evicts_least_recently_used(self, py_parser: Parser) -> None:
+        incremental = IncrementalParser(max_entries=2)
+        for name in ("a.py", "b.py", "c.py"):
+            incremental.parse(py_parser, Path(name), SOURCE)
+        assert len(incremental) == 2
+        assert Path("a.py") not in incremental
+
+
+class TestParseBatch:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_matches_sequential_parse(
+        self, py_parser: Parser, max_workers: int
+    ) -> None:
+        assert py_parser.language is not None
+        incremental = IncrementalParser()
+        sources = [SOURCE + f"def extra_{i}():\n    pass\n".encode() for i in range(8)]
+        jobs = [
+            ParseJob(Path(f"m{i}.py"), py_parser.language, source)
+            for i, source in enumerate(sources)
+        ]
+
+        trees = incremental.parse_batch(jobs, max_workers)
+
+        assert [str(t.root_node) for t in trees] == [
+            str(py_parser.parse(source).root_node) for source in sources
+        ]
+        assert len(incremental) == len(jobs)
+
+    def test_reuses_cached_trees(self, py_parser: Parser) -> None:
+        assert py_parser.language is not None
+        incremental = IncrementalParser()
+        path = Path("module.py")
+        incremental.parse(py_parser, path, SOURCE)
+        new = SOURCE.replace(b"pass", b"return None", 1)
+
+        (tree,) = incremental.parse_batch(
+            [ParseJob(path, py_parser.language, new)], max_workers=4
+        )
+
+        assert str(tree.root_node) == str(py_parser.parse(new).root_node)
+        assert incremental.trees[path][1] == new
+
+
+class TestGraphUpdaterIncrementalReparse:
+    def test_modified_file_is_reparsed_from_previous_tree(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        module = temp_repo / "module_a.py"
+        module.write_text("def func_a():\n    pass\n")
+        parsers, queries = load_parsers()
+        updater = GraphUpdater(
+            ingestor=mock_ingestor,
+            repo_path=temp_repo,
+            parsers=parsers,
+            queries=queries,
+        )
+        updater.run(force=True)
+        assert module in updater.incremental_parser
+
+        module.write_text("def func_a():\n    pass\n\n\ndef func_b():\n    pass\n")
+        updater.run(force=True)
+
+        assert f"{updater.project_name}.module_a.func_b" in updater.function_registry
+        assert updater.incremental_parser.trees[module][1] == module.read_bytes()
+
+    def test_deleted_file_forgets_tree(
+        self, temp_repo: Path, mock_ingestor: MagicMock
+    ) -> None:
+        module = temp_repo / "module_a.py"
+        module.write_text("def func_a():\n    pass\n")
+        parsers, queries = load_parsers()
+        updater = GraphUpdater(
+            ingestor=mock_ingestor,
+            repo_path=temp_repo,
+            parsers=parsers,
+            queries=queries,
+        )
+        updater.run()
+        module.unlink()
+        updater.run()
+        assert module not in updater.incremental_parser
@@ -336,6 +336,27 @@ class TestCodeChangeEventHandlerDebounce:
         # Should have 5 pending events (one per file)
         assert len(handler.pending_events) == 5
 
+    def test_file_vanishing_before_read_is_skipped(
+        self,
+        mock_updater: MagicMock,
+        mock_ingestor: MockQueryIngestor,
+        tmp_path: Path,
+    ) -> None:
+        from codebase_rag.constants import SupportedLanguage
+        from realtime_updater import CodeChangeEventHandler
+
+        mock_updater.parsers = {SupportedLanguage.PYTHON: MagicMock()}
+        handler = CodeChangeEventHandler(
+            mock_updater, debounce_seconds=0, max_wait_seconds=30
+        )
+
+        handler._process_change(FileModifiedEvent(str(tmp_path / "gone.py")))
+
+        mock_updater.factory.definition_processor.process_file.assert_not_called()
+        mock_updater.factory.structure_processor.process_generic_file.assert_not_called()
+        mock_updater._process_function_calls.assert_called_once()
+        mock_ingestor.flush_all.assert_called_once()
+
 
 class TestDebounceValidation:
     def test_validate_non_negative_float_accepts_zero(self) -> None:
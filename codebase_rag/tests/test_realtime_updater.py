@@ -49,6 +49,8 @@ def test_file_creation_flow(
         "python",
         mock_updater.queries,
         mock_updater.factory.structure_processor.structural_elements,
+        source_bytes=test_file.read_bytes(),
+        pre_parsed=mock_updater.pre_parse_file.return_value,
     )
     mock_updater.ingestor.flush_all.assert_called_once()
 
@@ -70,6 +72,8 @@ def test_file_modification_flow(
         "python",
         mock_updater.queries,
         mock_updater.factory.structure_processor.structural_elements,
+        source_bytes=test_file.read_bytes(),
+        pre_parsed=mock_updater.pre_parse_file.return_value,
     )
     mock_updater.ingestor.flush_all.assert_called_once()
 
@@ -86,6 +90,7 @@ def test_file_deletion_flow(
     # (H) 3 execute_write calls: DELETE_MODULE, DELETE_FILE, DELETE_CALLS
     assert mock_updater.ingestor.execute_write.call_count == 3
     mock_updater.factory.definition_processor.process_file.assert_not_called()
+    mock_updater.forget_parsed_tree.assert_called_once_with(test_file)
     mock_updater.ingestor.flush_all.assert_called_once()
 
 
@@ -1,9 +1,14 @@
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-from codebase_rag.graph_updater import FunctionRegistryTrie, GraphUpdater
+from codebase_rag.graph_updater import (
+    FunctionRegistryTrie,
+    GraphUpdater,
+    SimpleNameIndex,
+)
 from codebase_rag.parser_loader import load_parsers
 from codebase_rag.types_defs import NodeType
 
@@ -90,6 +95,197 @@ class TestTrieOptimization:
             assert result.startswith("com.example.services.")
             assert result.endswith(".create")
 
+    def test_radix_trie_compresses_single_child_chains(self) -> None:
+        """Test that a lone qualified name is stored on a single compressed edge."""
+        trie = FunctionRegistryTrie()
+        trie.insert("codebase_rag.parsers.factory.ProcessorFactory", NodeType.CLASS)
+
+        assert list(trie.root.edges) == ["codebase_rag"]
+        node = trie.root.edges["codebase_rag"]
+        assert node.label == (
+            "codebase_rag",
+            "parsers",
+            "factory",
+            "ProcessorFactory",
+        )
+        assert node.qn == "codebase_rag.parsers.factory.ProcessorFactory"
+        assert not node.edges
+
+    def test_radix_trie_splits_and_recompresses_edges(self) -> None:
+        """Test that diverging inserts split an edge and deletes merge it back."""
+        trie = FunctionRegistryTrie()
+        trie.insert("pkg.mod.Cls.method_a", NodeType.METHOD)
+        trie.insert("pkg.mod.Cls.method_b", NodeType.METHOD)
+
+        shared = trie.root.edges["pkg"]
+        assert shared.label == ("pkg", "mod", "Cls")
+        assert set(shared.edges) == {"method_a", "method_b"}
+
+        del trie["pkg.mod.Cls.method_a"]
+
+        node = trie.root.edges["pkg"]
+        assert node.label == ("pkg", "mod", "Cls", "method_b")
+        assert node.qn == "pkg.mod.Cls.method_b"
+        assert trie.find_with_prefix("pkg.mod") == [
+            ("pkg.mod.Cls.method_b", NodeType.METHOD)
+        ]
+
+    def test_leaf_nodes_allocate_no_edge_dict(self) -> None:
+        """Test that leaves keep edges unset and emptied parents release theirs."""
+        trie = FunctionRegistryTrie()
+        trie.insert("pkg.mod.func_a", NodeType.FUNCTION)
+        trie.insert("pkg.other.func_b", NodeType.FUNCTION)
+
+        shared = trie.root.edges["pkg"]
+        assert all(child.edges is None for child in shared.edges.values())
+        assert not hasattr(shared, "__dict__")
+
+        del trie["pkg.mod.func_a"]
+        del trie["pkg.other.func_b"]
+
+        assert trie.root.edges is None
+        assert trie.find_with_prefix("pkg") == []
+
+    def test_prefix_search_landing_mid_edge(self) -> None:
+        """Test that a prefix ending inside a compressed edge selects its subtree."""
+        trie = FunctionRegistryTrie()
+        trie.insert("project.services.user.UserService.create_user", NodeType.METHOD)
+
+        assert trie.find_with_prefix_and_suffix("project.services", "create_user") == [
+            "project.services.user.UserService.create_user"
+        ]
+        assert trie.find_with_prefix_and_suffix("project.models", "create_user") == []
+        assert trie.find_with_prefix("project.services.user.Other") == []
+
+    def test_suffix_index_tracks_inserts_and_deletes(self) -> None:
+        """Test that suffix lookups are served from the last-component index."""
+        trie = FunctionRegistryTrie()
+        trie.insert("pkg.a.Cls.run", NodeType.METHOD)
+        trie.insert("pkg.b.run", NodeType.FUNCTION)
+        trie.insert("run", NodeType.FUNCTION)
+
+        assert trie.find_ending_with("run") == ["pkg.a.Cls.run", "pkg.b.run"]
+        assert trie.find_with_prefix_and_suffix("pkg.a", "run") == ["pkg.a.Cls.run"]
+        assert trie.find_with_prefix_and_suffix("pkg", "Cls.run") == ["pkg.a.Cls.run"]
+
+        del trie["pkg.a.Cls.run"]
+        del trie["pkg.b.run"]
+        del trie["run"]
+
+        assert trie.find_with_prefix_and_suffix("", "run") == []
+        assert not trie._suffix_index
+
+    def test_attached_simple_name_lookup_replaces_suffix_index(self) -> None:
+        """Test that an attached lookup serves suffix queries without a copy."""
+        lookup = SimpleNameIndex()
+        trie = FunctionRegistryTrie(simple_name_lookup=lookup)
+        trie.insert("pkg.a.Cls.run", NodeType.METHOD)
+        trie.insert("pkg.b.run", NodeType.FUNCTION)
+
+        assert not trie._suffix_index
+        assert trie.find_with_prefix_and_suffix("pkg.a", "run") == ["pkg.a.Cls.run"]
+        assert trie.find_with_prefix_and_suffix("", "Cls.run") == ["pkg.a.Cls.run"]
+
+        del trie["pkg.a.Cls.run"]
+
+        assert trie.find_with_prefix_and_suffix("pkg", "run") == ["pkg.b.run"]
+        assert not trie._suffix_index
+
+    def test_prefix_and_suffix_results_are_sorted(self) -> None:
+        """Test that narrow and broad queries both return matches in sorted order."""
+        trie = FunctionRegistryTrie()
+        for i in reversed(range(50)):
+            trie.insert(f"pkg.mod{i}.Cls.run", NodeType.METHOD)
+        trie.insert("pkg.mod7.Cls.stop", NodeType.METHOD)
+        trie.insert("pkg.mod7.Cls.Inner.run", NodeType.METHOD)
+        trie.insert("pkg.mod7.Alpha.run", NodeType.METHOD)
+
+        narrow = trie.find_with_prefix_and_suffix("pkg.mod7", "run")
+        assert narrow == [
+            "pkg.mod7.Alpha.run",
+            "pkg.mod7.Cls.Inner.run",
+            "pkg.mod7.Cls.run",
+        ]
+        broad = trie.find_with_prefix_and_suffix("pkg", "run")
+        assert len(broad) == 52
+        assert broad == sorted(broad)
+        assert trie.find_with_prefix_and_suffix("", "run") == broad
+        assert trie.find_with_prefix_and_suffix("pkg", "Cls.stop") == [
+            "pkg.mod7.Cls.stop"
+        ]
+        assert trie.find_with_prefix_and_suffix("pkg.mod7", "missing") == []
+
+        for i in range(50, 500):
+            trie.insert(f"pkg.mod{i}.Cls.run", NodeType.METHOD)
+
+        assert trie.find_with_prefix_and_suffix("pkg.mod7", "run") == narrow
+
+    def test_insert_parts_matches_dotted_insert(self) -> None:
+        """Test that component tuples insert and query like dotted strings."""
+        trie = FunctionRegistryTrie()
+        trie.insert_parts(("pkg", "mod", "Cls", "run"), NodeType.METHOD)
+        trie.insert("pkg.mod.helper", NodeType.FUNCTION)
+
+        assert trie["pkg.mod.Cls.run"] == NodeType.METHOD
+        assert trie.root.edges["pkg"].label == ("pkg", "mod")
+        assert trie.find_with_prefix_and_suffix("pkg.mod", "run") == ["pkg.mod.Cls.run"]
+        assert trie.find_with_prefix_and_suffix("", "helper") == ["pkg.mod.helper"]
+        assert trie.find_with_prefix_and_suffix("pkg.other", "run") == []
+
+    def test_bulk_insert_matches_individual_inserts(self) -> None:
+        """Test that bulk inserts populate every index and drop stale lookups."""
+        trie = FunctionRegistryTrie()
+        trie.insert("pkg.a.run", NodeType.FUNCTION)
+        assert trie.find_ending_with("run") == ["pkg.a.run"]
+
+        trie.bulk_insert(
+            [("pkg.b.Cls", NodeType.CLASS), ("pkg.b.Cls.run", NodeType.METHOD)]
+        )
+
+        assert trie["pkg.b.Cls.run"] == NodeType.METHOD
+        assert trie.find_ending_with("run") == ["pkg.a.run", "pkg.b.Cls.run"]
+        assert trie.find_with_prefix("pkg.b") == [
+            ("pkg.b.Cls", NodeType.CLASS),
+            ("pkg.b.Cls.run", NodeType.METHOD),
+        ]
+
+    def test_delete_maintains_duplicate_and_property_indexes(self) -> None:
+        """Test that deletes update variant and property bookkeeping directly."""
+        trie = FunctionRegistryTrie()
+        trie.insert("pkg.mod.f", NodeType.FUNCTION)
+        variant_a = trie.register_unique_qn("pkg.mod.f", 10)
+        trie.insert(variant_a, NodeType.FUNCTION)
+        variant_b = trie.register_unique_qn("pkg.mod.f", 20)
+        trie.insert(variant_b, NodeType.FUNCTION)
+        trie.mark_property("pkg.a.Cls.value")
+        trie.mark_property("pkg.b.Cls.value")
+        trie.insert("pkg.a.Cls.value", NodeType.METHOD)
+        trie.insert("pkg.b.Cls.value", NodeType.METHOD)
+
+        del trie[variant_a]
+        assert trie.variants("pkg.mod.f") == ["pkg.mod.f", variant_b]
+        del trie[variant_b]
+        assert trie.variants("pkg.mod.f") == ["pkg.mod.f"]
+        assert not trie._variant_of
+
+        del trie["pkg.a.Cls.value"]
+        assert trie.property_names() == {"value"}
+        del trie["pkg.b.Cls.value"]
+        assert trie.property_names() == set()
+
+    def test_insert_interns_names_and_components(self) -> None:
+        """Test that QNs and their components share interned string objects."""
+        trie = FunctionRegistryTrie()
+        qn = "".join(["pkg.mod.", "Service"])
+        trie.insert(qn, NodeType.CLASS)
+        trie.insert("".join(["pkg.mod.", "Service.run"]), NodeType.METHOD)
+
+        (stored,) = (key for key in trie._entries if key.endswith("Service"))
+        assert stored is sys.intern("pkg.mod.Service")
+        (simple_name,) = (key for key in trie._suffix_index if key == "Service")
+        assert simple_name is sys.intern("Service")
+        assert trie.root.edges["pkg"].label[1] is sys.intern("mod")
+
     @pytest.fixture
     def graph_updater_with_trie(self) -> GraphUpdater:
         """Create GraphUpdater with populated Trie for testing."""
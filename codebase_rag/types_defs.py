@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, ItemsView, KeysView, Sequence
+from collections.abc import (
+    Awaitable,
+    Callable,
+    ItemsView,
+    Iterable,
+    KeysView,
+    MutableSet,
+    Sequence,
+)
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
@@ -54,7 +62,7 @@ class BatchWrapper(TypedDict):
 
 type SimpleName = str
 type QualifiedName = str
-type SimpleNameLookup = defaultdict[SimpleName, set[QualifiedName]]
+type SimpleNameLookup = defaultdict[SimpleName, MutableSet[QualifiedName]]
 
 NodeIdentifier = tuple[NodeLabel | str, str, str | None]
 
@@ -74,7 +82,6 @@ class NodeType(StrEnum):
     UNION = "Union"
 
 
-type TrieNode = dict[str, TrieNode | QualifiedName | NodeType]
 type FunctionRegistry = dict[QualifiedName, NodeType]
 
 
@@ -86,6 +93,8 @@ class FunctionRegistryTrieProtocol(Protocol):
         self, qualified_name: QualifiedName, func_type: NodeType
     ) -> None: ...
 
+    def bulk_insert(self, items: Iterable[tuple[QualifiedName, NodeType]]) -> None: ...
+
     def get(
         self, qualified_name: QualifiedName, default: NodeType | None = None
     ) -> NodeType | None: ...
@@ -229,28 +229,41 @@ class CodeChangeEventHandler(FileSystemEventHandler):
 
         # (H) Step 2: Clear in-memory state
         self.updater.remove_file_from_state(path)
+        if event.event_type == EventType.DELETED:
+            self.updater.forget_parsed_tree(path)
 
         # (H) Step 3: Re-parse code files and create File nodes for ALL files
         if event.event_type in (EventType.MODIFIED, EventType.CREATED):
             lang_config = get_language_spec(path.suffix)
+            unreadable = False
             if (
                 lang_config
                 and isinstance(lang_config.language, SupportedLanguage)
                 and lang_config.language in self.updater.parsers
             ):
-                if result := self.updater.factory.definition_processor.process_file(
-                    path,
-                    lang_config.language,
-                    self.updater.queries,
-                    self.updater.factory.structure_processor.structural_elements,
-                ):
-                    root_node, language = result
-                    self.updater.ast_cache[path] = (root_node, language)
-
-            # (H) Create File node for ALL files (code and non-code like .md, .json, etc.)
-            self.updater.factory.structure_processor.process_generic_file(
-                path, path.name
-            )
+                # (H) Temp-file-and-rename saves emit events for vanished paths.
+                try:
+                    file_bytes = path.read_bytes()
+                    pre_parsed = self.updater.pre_parse_file(path, file_bytes)
+                except OSError as e:
+                    logger.warning(logs.FILE_UNREADABLE.format(path=path, error=e))
+                    unreadable = True
+                else:
+                    if result := self.updater.factory.definition_processor.process_file(
+                        path,
+                        lang_config.language,
+                        self.updater.queries,
+                        self.updater.factory.structure_processor.structural_elements,
+                        source_bytes=file_bytes,
+                        pre_parsed=pre_parsed,
+                    ):
+                        self.updater._record_parsed_file(path, result)
+
+            if not unreadable:
+                # (H) Create File node for ALL files (code and non-code like .md, .json)
+                self.updater.factory.structure_processor.process_generic_file(
+                    path, path.name
+                )
 
         # (H) Step 4
         logger.info(logs.RECALC_CALLS)